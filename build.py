@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
+import argparse
 import os
 import sys
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from icon import create_icon
+
 def create_spec_file():
     """Create a PyInstaller spec file with custom settings."""
     return '''# -*- mode: python ; coding: utf-8 -*-
@@ -75,8 +79,16 @@ if platform.system() == 'Darwin':
     )
 '''
 
-def build_executable():
-    """Build the executable for the current platform."""
+def build_executable(lzfse: bool = False, max_compression: bool = False):
+    """
+    Build the executable for the current platform.
+    
+    Args:
+        lzfse (bool): Compress the macOS DMG with LZFSE (ULFO, macOS 10.11+)
+            instead of zlib
+        max_compression (bool): Compress the Windows ZIP with LZMA for final
+            releases instead of deflate level 6
+    """
     # Create spec file
     spec_content = create_spec_file()
     with open('VideoDownloader.spec', 'w') as f:
@@ -86,8 +98,23 @@ def build_executable():
     os.makedirs('dist', exist_ok=True)
     os.makedirs('build', exist_ok=True)
     
-    # Build the executable
-    subprocess.run(['pyinstaller', '--clean', 'VideoDownloader.spec'])
+    # Build the executable. UPX reads default options from the UPX environment
+    # variable; level 7 compresses nearly as well as --best in far less time.
+    env = dict(os.environ)
+    env.setdefault('UPX', '-7')
+    # Generate the icons while PyInstaller runs its analysis; the spec only
+    # reads them at the EXE step, once analysis has finished.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        icon_future = executor.submit(create_icon)
+        pyinstaller = subprocess.Popen(['pyinstaller', '--clean', 'VideoDownloader.spec'], env=env)
+        try:
+            icon_future.result()
+        except BaseException:
+            # Don't leave PyInstaller packaging stale icons in the background
+            pyinstaller.kill()
+            raise
+        finally:
+            pyinstaller.wait()
     
     # Create release directory
     release_dir = Path('release')
@@ -102,7 +129,11 @@ def build_executable():
         exe_path = Path('dist/VideoDownloader.exe')
         if exe_path.exists():
             release_zip = release_dir / 'VideoDownloader-Windows.zip'
-            with zipfile.ZipFile(release_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            if max_compression:
+                zip_options = {'compression': zipfile.ZIP_LZMA}
+            else:
+                zip_options = {'compression': zipfile.ZIP_DEFLATED, 'compresslevel': 6}
+            with zipfile.ZipFile(release_zip, 'w', **zip_options) as zipf:
                 zipf.write(exe_path, exe_path.name)
                 zipf.write('README.md')
                 zipf.write('LICENSE')
@@ -113,12 +144,23 @@ def build_executable():
         app_path = Path('dist/VideoDownloader.app')
         if app_path.exists():
             dmg_path = release_dir / 'VideoDownloader-macOS.dmg'
+            if lzfse:
+                image_format = ['-format', 'ULFO']
+            else:
+                # zlib level 6 is nearly as small as the default level 9 but much faster
+                image_format = ['-format', 'UDZO', '-imagekey', 'zlib-level=6']
             subprocess.run([
                 'hdiutil', 'create', '-volname', 'VideoDownloader',
-                '-srcfolder', app_path, '-ov', '-format', 'UDZO',
-                dmg_path
+                '-srcfolder', str(app_path), '-ov', *image_format,
+                str(dmg_path)
             ])
             print(f"macOS release created: {dmg_path}")
 
 if __name__ == '__main__':
-    build_executable() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Build Video Downloader release packages.")
+    parser.add_argument('--lzfse', action='store_true',
+                        help="compress the macOS DMG with LZFSE instead of zlib")
+    parser.add_argument('--max-compression', action='store_true',
+                        help="compress the Windows ZIP with LZMA for final releases")
+    args = parser.parse_args()
+    build_executable(lzfse=args.lzfse, max_compression=args.max_compression) 
\ No newline at end of file
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 
-from PIL import Image, ImageDraw
 import os
+import shutil
+import subprocess
 
 def create_icon():
     """Create a simple icon for the application."""
+    # Imported here so importing this module does not load Pillow
+    from PIL import Image, ImageDraw
+    
     sizes = {
         'ico': [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)],
         'icns': [(16, 16), (32, 32), (64, 64), (128, 128), (256, 256), (512, 512), (1024, 1024)]
@@ -34,31 +38,46 @@ def create_icon():
         
         return img
     
+    # Draw once at the largest size and downsample for every other size
+    master = create_base_image(1024)
+    
+    def resized(size):
+        """Return the master image scaled to the specified size."""
+        return master if size == master.size else master.resize(size, Image.LANCZOS)
+    
     # Create Windows ICO
-    ico_images = []
-    for size in sizes['ico']:
-        ico_images.append(create_base_image(size[0]))
+    ico_images = [resized(size) for size in sizes['ico']]
     
     ico_path = 'icon.ico'
-    ico_images[0].save(ico_path, format='ICO', sizes=sizes['ico'])
+    # Save from the largest frame; Pillow skips ICO sizes bigger than the base image.
+    # Write to a temporary name and swap it in so a build reading the icon
+    # concurrently never sees a partly written file.
+    ico_images[-1].save('icon-tmp.ico', format='ICO', sizes=sizes['ico'], append_images=ico_images[:-1])
+    os.replace('icon-tmp.ico', ico_path)
     print(f"Created Windows icon: {ico_path}")
     
     # Create macOS ICNS
-    if os.system('which iconutil') == 0:  # Check if iconutil is available (macOS)
+    if shutil.which('iconutil') is not None:  # Check if iconutil is available (macOS)
         iconset_path = 'icon.iconset'
         os.makedirs(iconset_path, exist_ok=True)
         
+        # zlib level 6 is within a few percent of level 9 for a fraction of the CPU time
+        png_options = {'compress_level': 6, 'optimize': False}
+        
         for size in sizes['icns']:
-            img = create_base_image(size[0])
+            img = resized(size)
             icon_size = size[0]
             if icon_size <= 32:
-                img.save(f"{iconset_path}/icon_16x16@2x.png" if icon_size == 32 else f"{iconset_path}/icon_16x16.png")
+                img.save(f"{iconset_path}/icon_16x16@2x.png" if icon_size == 32 else f"{iconset_path}/icon_16x16.png", **png_options)
             else:
-                img.save(f"{iconset_path}/icon_{icon_size}x{icon_size}.png")
-                img.save(f"{iconset_path}/icon_{icon_size//2}x{icon_size//2}@2x.png")
+                canonical_path = f"{iconset_path}/icon_{icon_size}x{icon_size}.png"
+                img.save(canonical_path, **png_options)
+                # The @2x variant of half the size has identical pixels, so copy instead of re-encoding
+                shutil.copyfile(canonical_path, f"{iconset_path}/icon_{icon_size//2}x{icon_size//2}@2x.png")
         
-        os.system(f"iconutil -c icns {iconset_path}")
-        os.system(f"rm -rf {iconset_path}")
+        subprocess.run(['iconutil', '-c', 'icns', iconset_path, '-o', 'icon-tmp.icns'], check=True)
+        os.replace('icon-tmp.icns', 'icon.icns')
+        shutil.rmtree(iconset_path)
         print("Created macOS icon: icon.icns")
 
 if __name__ == '__main__':
@@ -1,15 +1,111 @@
 #!/usr/bin/env python3
 
+import functools
+import hashlib
+import json
 import os
 import re
-import requests
-import yt_dlp
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
+
+# yt_dlp and requests are imported where they are used so that each download
+# path only pays for the library it needs
+if TYPE_CHECKING:
+    import requests
+    import yt_dlp
+
+# Characters that are not allowed in filenames on common platforms
+_INVALID_FN_RE = re.compile(r'[<>:"/\\|?*]')
+# Start offset of a "Content-Range: bytes <start>-<end>/<size>" header
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-')
+# Hosts handled by yt-dlp rather than a direct download
+_YTDLP_HOSTS_RE = re.compile(r'(?:youtube\.com|youtu\.be|vimeo\.com|dailymotion\.com)', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_filename(filename: str) -> str:
+    """
+    Remove invalid characters from filename.
+    
+    Args:
+        filename (str): Original filename
+        
+    Returns:
+        str: Sanitized filename
+    """
+    # Remove invalid characters and limit length
+    return _INVALID_FN_RE.sub('', filename)[:255]
+
+class _ProgressReporter:
+    """Print download progress, throttled to avoid a console write per chunk."""
+    
+    def __init__(self, interval: float = 0.2):
+        """
+        Initialize the reporter.
+        
+        Args:
+            interval (float): Minimum number of seconds between updates
+        """
+        self.interval = interval
+        self.last_time = 0.0
+        self.last_pct = -1
+    
+    def report(self, downloaded: int, total: int) -> None:
+        """
+        Report progress, printing only if enough time passed or the percentage changed.
+        
+        Args:
+            downloaded (int): Bytes downloaded so far
+            total (int): Total bytes expected, or 0 if unknown
+        """
+        now = time.monotonic()
+        if total > 0:
+            percentage = (downloaded / total) * 100
+            if now - self.last_time < self.interval and int(percentage) == self.last_pct:
+                return
+            self.last_pct = int(percentage)
+            message = f"\rDownload Progress: {percentage:.1f}%"
+        else:
+            if now - self.last_time < self.interval:
+                return
+            message = f"\rDownloaded: {downloaded / 1024 / 1024:.1f}MB"
+        self.last_time = now
+        sys.stdout.write(message)
+        sys.stdout.flush()
 
 class VideoDownloader:
     """A class to handle video downloads from various sources."""
     
+    # Seconds a cached yt-dlp info dict stays valid
+    INFO_CACHE_TTL = 3600
+    
+    # yt-dlp options shared by every download; per-instance keys are added in __init__
+    YDL_OPTS = {
+        'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',  # Prefer MP4
+        'quiet': False,
+        'no_warnings': False,
+        'ignoreerrors': True,
+        'nocheckcertificate': True,
+        'geo_bypass': True,
+        'extract_flat': False,
+        'force_generic_extractor': False,
+        'concurrent_fragment_downloads': 16,  # Speed up download with multiple connections
+        # 0 defers to each format's own chunk size: YouTube formats keep yt-dlp's
+        # 10MB ranges, and progressive streams without one are fetched in one request
+        'http_chunk_size': 0,
+        'retries': 3,
+        'fragment_retries': 3,
+        # Merge video and audio straight into MP4 by stream copy, never re-encoding
+        'merge_output_format': 'mp4',
+        'postprocessor_args': {
+            'merger+ffmpeg_o1': ['-c', 'copy', '-movflags', '+faststart'],
+        },
+    }
+    
     def __init__(self, download_path: str = "downloads"):
         """
         Initialize the VideoDownloader.
@@ -18,15 +114,26 @@ class VideoDownloader:
             download_path (str): Directory where videos will be saved
         """
         self.download_path = download_path
+        # Separator for building output paths from a single file name
+        self._sep = os.sep
         # Create downloads directory if it doesn't exist
         os.makedirs(download_path, exist_ok=True)
+        self._ydl_opts = {
+            **self.YDL_OPTS,
+            'outtmpl': os.path.join(download_path, '%(title)s.%(ext)s'),
+            'progress_hooks': [self._progress_hook],
+        }
+        self._reporter = _ProgressReporter()
+        self._session: Optional['requests.Session'] = None
     
-    def download_video(self, url: str) -> Optional[str]:
+    def download_video(self, url: str, use_cache: bool = True, verbose: bool = False) -> Optional[str]:
         """
         Download a video from the given URL.
         
         Args:
             url (str): URL of the video to download
+            use_cache (bool): Reuse recently extracted video info for this URL
+            verbose (bool): List the available formats before downloading
             
         Returns:
             Optional[str]: Path to the downloaded file or None if download fails
@@ -38,8 +145,9 @@ class VideoDownloader:
                 raise ValueError("Invalid URL format")
 
             # Handle YouTube and other supported platforms
-            if any(domain in url for domain in ['youtube.com', 'youtu.be', 'vimeo.com', 'dailymotion.com']):
-                return self._download_with_ytdlp(url)
+            host = parsed_url.netloc.lower()
+            if _YTDLP_HOSTS_RE.search(host):
+                return self._download_with_ytdlp(url, use_cache, verbose)
             
             # Handle direct video URLs
             return self._download_direct_video(url)
@@ -57,78 +165,173 @@ class VideoDownloader:
         """
         if d['status'] == 'downloading':
             if 'total_bytes' in d:
-                percentage = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                print(f"\rDownload Progress: {percentage:.1f}%", end="")
+                self._reporter.report(d['downloaded_bytes'], d['total_bytes'])
             elif 'downloaded_bytes' in d:
-                print(f"\rDownloaded: {d['downloaded_bytes'] / 1024 / 1024:.1f}MB", end="")
+                self._reporter.report(d['downloaded_bytes'], 0)
         elif d['status'] == 'finished':
             print("\nDownload completed. Processing video...")
     
-    def _download_with_ytdlp(self, url: str) -> Optional[str]:
+    def _download_with_ytdlp(self, url: str, use_cache: bool = True, verbose: bool = False) -> Optional[str]:
         """
         Download a video using yt-dlp.
         
         Args:
             url (str): Video URL
+            use_cache (bool): Reuse recently extracted video info for this URL
+            verbose (bool): List the available formats before downloading
             
         Returns:
             Optional[str]: Path to the downloaded file or None if download fails
         """
+        import yt_dlp
+        from yt_dlp.postprocessor import FFmpegVideoRemuxerPP
+        
         try:
-            ydl_opts = {
-                'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',  # Prefer MP4
-                'outtmpl': os.path.join(self.download_path, '%(title)s.%(ext)s'),
-                'progress_hooks': [self._progress_hook],
-                'quiet': False,
-                'no_warnings': False,
-                'ignoreerrors': True,
-                'nocheckcertificate': True,
-                'geo_bypass': True,
-                'extract_flat': False,
-                'force_generic_extractor': False,
-                'concurrent_fragment_downloads': 5,  # Speed up download with multiple connections
-                'http_chunk_size': 10485760,  # 10MB chunks for better progress reporting
-                'postprocessors': [{
-                    'key': 'FFmpegVideoConvertor',
-                    'preferedformat': 'mp4',
-                }],
-            }
-
-            # Get video info first
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            # Get video info first. YoutubeDL fills in defaults on the dict it is
+            # given, so each instance gets its own copy of the options.
+            with yt_dlp.YoutubeDL(dict(self._ydl_opts)) as ydl:
+                if use_cache:
+                    info = self._get_cached_info(ydl, url)
+                else:
+                    info = ydl.extract_info(url, download=False)
                 print(f"\nTitle: {info.get('title', 'Unknown')}")
                 print(f"Duration: {info.get('duration', 0)} seconds")
                 print(f"Description: {info.get('description', 'No description')[:200]}...")
                 
                 # Show available formats
-                formats = info.get('formats', [])
-                print("\nAvailable formats:")
-                for f in formats:
-                    if 'height' in f and 'ext' in f:
-                        print(f"- {f.get('height', 'N/A')}p ({f.get('ext', 'N/A')})")
+                if verbose:
+                    formats = info.get('formats', [])
+                    print("\nAvailable formats:\n" + "\n".join(
+                        f"- {f['height']}p ({f['ext']})"
+                        for f in formats if 'height' in f and 'ext' in f
+                    ))
                 
-                # Download the video
+                # Merged formats already end up as MP4; remux any other single file
+                if info.get('ext') != 'mp4':
+                    ydl.add_post_processor(FFmpegVideoRemuxerPP(ydl, preferedformat='mp4'))
+                
+                # Download the video, reusing the info extracted above
                 print("\nStarting download...")
-                ydl.download([url])
+                result = ydl.process_ie_result(info, download=True) or info
                 
-                # Get the output filename
-                output_path = os.path.join(
-                    self.download_path,
-                    self._sanitize_filename(info['title']) + '.mp4'
-                )
+                # Use the path yt-dlp actually wrote. With ignoreerrors a failed
+                # download is not raised, it just leaves no file behind.
+                requested = result.get('requested_downloads') or [{}]
+                output_path = requested[0].get('filepath')
+                if not output_path or not os.path.exists(output_path):
+                    print("\nError downloading video: no file was written")
+                    self._drop_cached_info(url)
+                    return None
                 
                 print(f"\nSuccessfully downloaded: {os.path.basename(output_path)}")
                 return output_path
             
         except Exception as e:
             print(f"\nError downloading video: {str(e)}")
+            # The cached format URLs may have expired; extract afresh next time
+            self._drop_cached_info(url)
             if "429" in str(e):
                 print("Too many requests. Please try again later.")
             elif "403" in str(e):
                 print("Access forbidden. This might be due to regional restrictions.")
             return None
     
+    def _get_cached_info(self, ydl: 'yt_dlp.YoutubeDL', url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract video info, reusing a cached copy if it is recent enough.
+        
+        Args:
+            ydl (yt_dlp.YoutubeDL): Downloader used to extract the info on a cache miss
+            url (str): Video URL
+            
+        Returns:
+            Optional[Dict[str, Any]]: Video info dictionary or None if extraction fails
+        """
+        cache_path = self._info_cache_path(url)
+        cache_dir = os.path.dirname(cache_path)
+        
+        try:
+            if time.time() - os.path.getmtime(cache_path) < self.INFO_CACHE_TTL:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable cache entry; extract fresh info below
+            pass
+        
+        info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+        if info:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._prune_info_cache(cache_dir)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(info, f)
+        return info
+    
+    def _info_cache_path(self, url: str) -> str:
+        """
+        Get the path of the cached info file for a URL.
+        
+        Args:
+            url (str): Video URL
+            
+        Returns:
+            str: Path of the cache entry, which may not exist
+        """
+        return f"{self.download_path}{self._sep}.ytdlp-cache{self._sep}{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+    
+    def _drop_cached_info(self, url: str) -> None:
+        """
+        Remove the cached info for a URL so the next download extracts it again.
+        
+        Args:
+            url (str): Video URL
+        """
+        try:
+            os.remove(self._info_cache_path(url))
+        except OSError:
+            # Nothing was cached for this URL
+            pass
+    
+    def _prune_info_cache(self, cache_dir: str) -> None:
+        """
+        Delete cached info entries that are too old to be used again.
+        
+        Args:
+            cache_dir (str): Directory holding the cached info files
+        """
+        cutoff = time.time() - self.INFO_CACHE_TTL
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    # Removed concurrently or not accessible; leave it
+                    pass
+    
+    def _get_session(self) -> 'requests.Session':
+        """
+        Get the HTTP session used for direct downloads, creating it on first use.
+        
+        Returns:
+            requests.Session: Session that reuses connections and retries transient failures
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                                  max_retries=Retry(total=3, backoff_factor=0.3))
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+        return self._session
+    
     def _download_direct_video(self, url: str) -> Optional[str]:
         """
         Download a video from a direct URL.
@@ -141,10 +344,7 @@ class VideoDownloader:
         """
         try:
             # Send a GET request with stream=True to handle large files
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, stream=True, headers=headers)
+            response = self._get_session().get(url, stream=True)
             response.raise_for_status()
             
             # Try to get filename from Content-Disposition header
@@ -157,24 +357,52 @@ class VideoDownloader:
                 if not filename:
                     filename = "video.mp4"
             
-            filename = self._sanitize_filename(filename)
-            output_path = os.path.join(self.download_path, filename)
+            filename = _sanitize_filename(filename)
+            output_path = f"{self.download_path}{self._sep}{filename}"
             
             # Get total file size
             total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
-            downloaded = 0
+            block_size = 1024 * 1024
             
-            # Download the file in chunks with progress
             print(f"\nDownloading: {filename}")
+            
+            # Split large files into parallel range requests when the server allows it;
+            # the size and range support come from this response, so no HEAD is needed.
+            # Platforms without os.pwrite keep streaming this response instead.
+            accept_ranges = response.headers.get('accept-ranges', '').lower()
+            if (hasattr(os, 'pwrite') and total_size > block_size and accept_ranges == 'bytes'
+                    and not response.headers.get('content-encoding')):
+                response.close()
+                if self._download_direct_parallel(url, output_path, total_size):
+                    print(f"\nSuccessfully downloaded: {filename}")
+                    return output_path
+                response = self._get_session().get(url, stream=True)
+                response.raise_for_status()
+            
+            # Download the file in chunks with progress
             with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=block_size):
-                    if chunk:
+                if response.headers.get('content-encoding'):
+                    # Let requests handle decoding of compressed responses
+                    reporter = _ProgressReporter()
+                    # 256 KiB matches a full socket receive buffer; empty keep-alive
+                    # chunks are harmless to write so they are not filtered out
+                    for chunk in response.iter_content(chunk_size=256 * 1024):
                         f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            percentage = (downloaded / total_size) * 100
-                            print(f"\rDownload Progress: {percentage:.1f}%", end="")
+                        # content-length counts compressed bytes, so track progress
+                        # by what was read from the wire rather than decoded sizes
+                        reporter.report(response.raw.tell(), total_size)
+                else:
+                    if total_size > block_size:
+                        self._preallocate(f, total_size)
+                    # Copy straight from the socket to disk in large blocks
+                    response.raw.decode_content = True
+                    response.raw.read = self._progress_reader(response.raw.read, total_size)
+                    try:
+                        shutil.copyfileobj(response.raw, f, length=block_size)
+                    finally:
+                        # Drop any preallocated space that was not written, so an
+                        # interrupted download does not look like a complete file
+                        f.truncate(f.tell())
             
             print(f"\nSuccessfully downloaded: {filename}")
             return output_path
@@ -183,20 +411,114 @@ class VideoDownloader:
             print(f"\nError downloading video: {str(e)}")
             return None
     
-    def _sanitize_filename(self, filename: str) -> str:
+    def _download_direct_parallel(self, url: str, output_path: str, total_size: int, n: int = 8) -> bool:
+        """
+        Download a file using parallel HTTP range requests.
+        
+        Args:
+            url (str): Direct video URL
+            output_path (str): Where to write the file
+            total_size (int): File size in bytes, from a response that advertised range support
+            n (int): Number of parallel connections
+            
+        Returns:
+            bool: True if the file was downloaded, False if the server does not
+            support range requests and the caller should fall back to a single stream
+        """
+        session = self._get_session()
+        block_size = 1024 * 1024
+        segment = -(-total_size // n)
+        ranges = [(lo, min(lo + segment, total_size) - 1) for lo in range(0, total_size, segment)]
+        
+        lock = threading.Lock()
+        reporter = _ProgressReporter()
+        downloaded = 0
+        
+        def report(size: int) -> None:
+            nonlocal downloaded
+            with lock:
+                downloaded += size
+                reporter.report(downloaded, total_size)
+        
+        def fetch(lo: int, hi: int) -> bool:
+            # Ask for the unencoded bytes so the body maps directly onto file offsets
+            range_headers = {'Range': f'bytes={lo}-{hi}', 'Accept-Encoding': 'identity'}
+            with session.get(url, stream=True, headers=range_headers) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    # Server ignored the Range header and is sending the whole file
+                    return False
+                content_range = _CONTENT_RANGE_RE.match(r.headers.get('content-range', ''))
+                if (r.headers.get('content-encoding') or not content_range
+                        or int(content_range.group(1)) != lo):
+                    # Compressed or misplaced ranges cannot be written at this offset
+                    return False
+                offset = lo
+                for chunk in r.raw.stream(block_size, decode_content=False):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    report(len(chunk))
+            return True
+        
+        completed = False
+        try:
+            with open(output_path, 'wb') as f:
+                fd = f.fileno()
+                # Reserve the full file up front so every worker can write at its own offset
+                self._preallocate(f, total_size)
+                
+                with ThreadPoolExecutor(max_workers=n) as executor:
+                    futures = [executor.submit(fetch, lo, hi) for lo, hi in ranges]
+                    completed = all(future.result() for future in futures)
+        finally:
+            # A preallocated file with missing ranges would look complete, so remove it
+            if not completed:
+                try:
+                    os.remove(output_path)
+                except OSError:
+                    pass
+        return completed
+    
+    def _preallocate(self, f, size: int) -> None:
         """
-        Remove invalid characters from filename.
+        Reserve disk space for a file so it is allocated in one extent.
         
         Args:
-            filename (str): Original filename
+            f: File object opened for writing
+            size (int): Number of bytes to reserve
+        """
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(f.fileno(), 0, size)
+            else:
+                # Extends the file via SetEndOfFile on Windows
+                f.truncate(size)
+        except OSError:
+            # Not supported by every filesystem; the file simply grows as it is written
+            pass
+    
+    def _progress_reader(self, read, total_size: int):
+        """
+        Wrap a read callable so every read is reported to a progress reporter.
+        
+        Args:
+            read: The underlying read callable
+            total_size (int): Expected number of bytes, or 0 if unknown
             
         Returns:
-            str: Sanitized filename
+            A read callable with the same signature as ``read``
         """
-        # Remove invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-        # Limit length
-        return filename[:255]
+        reporter = _ProgressReporter()
+        downloaded = 0
+        
+        def reader(*args, **kwargs):
+            nonlocal downloaded
+            data = read(*args, **kwargs)
+            downloaded += len(data)
+            reporter.report(downloaded, total_size)
+            return data
+        
+        return reader
 
 def main():
     """Main function to demonstrate usage."""
@@ -204,7 +526,7 @@ def main():
     
     # Example usage
     url = input("Enter video URL to download: ")
-    result = downloader.download_video(url)
+    result = downloader.download_video(url, verbose=True)
     
     if result:
         print(f"Video downloaded successfully to: {result}")
@@ -1,37 +1,203 @@
 #!/usr/bin/env python3
 
+import json
 import os
 import sys
+import threading
+import time
 import yt_dlp
 import subprocess
 import platform
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLineEdit, QTableWidget, QTableWidgetItem, QProgressBar,
     QLabel, QMessageBox, QHeaderView, QFrame, QGraphicsOpacityEffect,
     QStyleOption, QStyle, QScrollArea, QMenu, QToolButton
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer, QSize, QRect, QUrl
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer, QSize, QUrl
 from PyQt6.QtGui import QIcon, QColor, QPainter, QPalette, QDesktopServices, QPixmap
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+try:
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+except ImportError:  # PyQt6-WebEngine is optional
+    QWebEngineView = None
 from qt_material import apply_stylesheet, list_themes
 
+# yt-dlp options shared by every YoutubeDL the GUI creates
+_BASE_YDL_OPTS = {'quiet': True, 'no_warnings': True}
+
+# How long closing the window waits for a running info lookup, in milliseconds
+INFO_THREAD_CLOSE_TIMEOUT_MS = 2000
+
+def _spawn(args: list):
+    """Launch a helper process without waiting for it."""
+    subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+# Show a file in the platform's file manager, picked once at import time.
+# None of these wait on the file manager, so the GUI never blocks.
+_SYSTEM = platform.system()
+if _SYSTEM == 'Windows':
+    def _reveal(filename: str):
+        threading.Thread(target=os.startfile, args=(os.path.dirname(filename),), daemon=True).start()
+elif _SYSTEM == 'Darwin':  # macOS
+    def _reveal(filename: str):
+        _spawn(['open', '-R', filename])
+else:  # Linux
+    def _reveal(filename: str):
+        _spawn(['xdg-open', os.path.dirname(filename)])
+
+# Styles for the custom widgets, applied once for the whole application in main()
+APP_QSS = """
+    #materialFrame {
+        background-color: rgba(255, 255, 255, 0.05);
+        border-radius: 10px;
+        padding: 10px;
+    }
+    #animatedButton {
+        background-color: #009688;
+        border-radius: 20px;
+        padding: 10px;
+        color: white;
+        font-weight: bold;
+    }
+    #animatedButton:hover {
+        background-color: #00796B;
+    }
+    #animatedButton:pressed {
+        background-color: #00695C;
+    }
+    #materialLineEdit {
+        background-color: rgba(255, 255, 255, 0.1);
+        border: none;
+        border-radius: 20px;
+        padding: 10px 20px;
+        color: white;
+        font-size: 14px;
+    }
+    #materialLineEdit:focus {
+        background-color: rgba(255, 255, 255, 0.15);
+    }
+    #materialTable {
+        background-color: rgba(255, 255, 255, 0.05);
+        border: none;
+        border-radius: 10px;
+        gridline-color: rgba(255, 255, 255, 0.1);
+    }
+    #materialTable::item {
+        padding: 10px;
+    }
+    #materialTable::item:selected {
+        background-color: rgba(0, 150, 136, 0.3);
+    }
+    #materialTable QHeaderView::section {
+        background-color: rgba(255, 255, 255, 0.1);
+        padding: 10px;
+        border: none;
+        font-weight: bold;
+    }
+    #materialProgressBar {
+        border: none;
+        border-radius: 15px;
+        background-color: rgba(255, 255, 255, 0.1);
+        text-align: center;
+    }
+    #materialProgressBar::chunk {
+        background-color: #009688;
+        border-radius: 15px;
+    }
+    #previewFrame {
+        background-color: rgba(255, 255, 255, 0.05);
+        border-radius: 10px;
+        padding: 10px;
+    }
+    #thumbnailLabel, #previewWebView {
+        border-radius: 5px;
+    }
+    #historyHeader {
+        font-size: 16px;
+        font-weight: bold;
+        color: #009688;
+        margin-bottom: 10px;
+    }
+    #historyList {
+        background-color: transparent;
+        border: none;
+    }
+    #historyList::item {
+        padding: 5px;
+    }
+    QToolButton#historyActionsBtn {
+        border: none;
+        padding: 5px;
+        color: white;
+    }
+    QToolButton#historyActionsBtn:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 3px;
+    }
+    QMenu#historyMenu {
+        background-color: #424242;
+        border: 1px solid #555;
+        border-radius: 3px;
+    }
+    QMenu#historyMenu::item {
+        padding: 5px 20px;
+        color: white;
+    }
+    QMenu#historyMenu::item:selected {
+        background-color: #009688;
+    }
+    #titleLabel {
+        font-size: 24px;
+        font-weight: bold;
+        color: #009688;
+        margin-bottom: 20px;
+    }
+    #infoLabel {
+        font-size: 14px;
+        color: rgba(255, 255, 255, 0.87);
+        padding: 10px;
+    }
+    #statusLabel {
+        font-size: 13px;
+        color: rgba(255, 255, 255, 0.6);
+    }
+    QMessageBox#downloadMsg, QMessageBox#errorMsg {
+        background-color: #424242;
+    }
+    QMessageBox#downloadMsg QLabel, QMessageBox#errorMsg QLabel {
+        color: white;
+    }
+    QMessageBox#downloadMsg QPushButton, QMessageBox#errorMsg QPushButton {
+        background-color: #009688;
+        color: white;
+        border: none;
+        padding: 5px 15px;
+        border-radius: 3px;
+    }
+    QMessageBox#downloadMsg QPushButton {
+        min-width: 100px;
+    }
+    QMessageBox#downloadMsg QPushButton:hover, QMessageBox#errorMsg QPushButton:hover {
+        background-color: #00796B;
+    }
+"""
+
 class MaterialFrame(QFrame):
     """A custom frame with material design shadow and hover effects."""
     
+    # Translucent white drawn over the frame while hovered
+    _HOVER_OVERLAY = QColor(255, 255, 255, 20)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("materialFrame")
         self._hover = False
-        self.setStyleSheet("""
-            #materialFrame {
-                background-color: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
+        # Style option reused by every paint; painting only happens on the GUI thread
+        self._style_option = QStyleOption()
         
     def enterEvent(self, event):
         self._hover = True
@@ -44,7 +210,7 @@ class MaterialFrame(QFrame):
         super().leaveEvent(event)
         
     def paintEvent(self, event):
-        opt = QStyleOption()
+        opt = self._style_option
         opt.initFrom(self)
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -54,48 +220,14 @@ class MaterialFrame(QFrame):
         
         # Draw hover effect
         if self._hover:
-            p.fillRect(self.rect(), QColor(255, 255, 255, 20))
+            p.fillRect(self.rect(), self._HOVER_OVERLAY)
 
 class AnimatedButton(QPushButton):
-    """A button with hover and click animations."""
+    """A button with hover and pressed feedback from the :hover/:pressed QSS states."""
     
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setObjectName("animatedButton")
-        self.setStyleSheet("""
-            #animatedButton {
-                background-color: #009688;
-                border-radius: 20px;
-                padding: 10px;
-                color: white;
-                font-weight: bold;
-            }
-            #animatedButton:hover {
-                background-color: #00796B;
-            }
-            #animatedButton:pressed {
-                background-color: #00695C;
-            }
-        """)
-        self._animation = QPropertyAnimation(self, b"geometry")
-        self._animation.setDuration(100)
-        
-    def enterEvent(self, event):
-        self._animate_hover(True)
-        super().enterEvent(event)
-        
-    def leaveEvent(self, event):
-        self._animate_hover(False)
-        super().leaveEvent(event)
-        
-    def _animate_hover(self, hover: bool):
-        rect = self.geometry()
-        if hover:
-            target = QRect(rect.x(), rect.y() - 2, rect.width(), rect.height())
-        else:
-            target = QRect(rect.x(), rect.y() + 2, rect.width(), rect.height())
-        self._animation.setEndValue(target)
-        self._animation.start()
 
 class MaterialLineEdit(QLineEdit):
     """A custom line edit with material design styling."""
@@ -103,19 +235,6 @@ class MaterialLineEdit(QLineEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("materialLineEdit")
-        self.setStyleSheet("""
-            #materialLineEdit {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 20px;
-                padding: 10px 20px;
-                color: white;
-                font-size: 14px;
-            }
-            #materialLineEdit:focus {
-                background-color: rgba(255, 255, 255, 0.15);
-            }
-        """)
 
 class MaterialTable(QTableWidget):
     """A custom table with material design styling."""
@@ -123,28 +242,6 @@ class MaterialTable(QTableWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("materialTable")
-        self.setStyleSheet("""
-            #materialTable {
-                background-color: rgba(255, 255, 255, 0.05);
-                border: none;
-                border-radius: 10px;
-                gridline-color: rgba(255, 255, 255, 0.1);
-            }
-            #materialTable::item {
-                padding: 10px;
-            }
-            #materialTable::item:selected {
-                background-color: rgba(0, 150, 136, 0.3);
-            }
-        """)
-        self.horizontalHeader().setStyleSheet("""
-            QHeaderView::section {
-                background-color: rgba(255, 255, 255, 0.1);
-                padding: 10px;
-                border: none;
-                font-weight: bold;
-            }
-        """)
 
 class MaterialProgressBar(QProgressBar):
     """A custom progress bar with material design styling."""
@@ -152,18 +249,6 @@ class MaterialProgressBar(QProgressBar):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("materialProgressBar")
-        self.setStyleSheet("""
-            #materialProgressBar {
-                border: none;
-                border-radius: 15px;
-                background-color: rgba(255, 255, 255, 0.1);
-                text-align: center;
-            }
-            #materialProgressBar::chunk {
-                background-color: #009688;
-                border-radius: 15px;
-            }
-        """)
 
 class DownloaderThread(QThread):
     """Worker thread for downloading videos."""
@@ -172,30 +257,60 @@ class DownloaderThread(QThread):
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
     
-    def __init__(self, url: str, format_id: str, download_path: str):
+    def __init__(self, url: str, format_id: str, download_path: Union[str, Path],
+                 http_chunk_size: int = 10 * 1024 * 1024):
         super().__init__()
         self.url = url
         self.format_id = format_id
         self.download_path = download_path
+        # Output template, built once from the download directory
+        self._outtmpl = str(Path(download_path) / '%(title)s.%(ext)s')
+        self.http_chunk_size = http_chunk_size
+        # Last emitted progress, used to throttle signals to the GUI thread
+        self._last_emit_ns = 0
+        self._last_pct = -1.0
         
     def progress_hook(self, d: Dict[str, Any]) -> None:
         """Progress callback for yt-dlp."""
-        if d['status'] == 'downloading':
+        if d['status'] in ('downloading', 'finished'):
             if 'total_bytes' in d:
-                percentage = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                self.progress.emit(percentage)
+                value = (d['downloaded_bytes'] / d['total_bytes']) * 100
             elif 'downloaded_bytes' in d:
-                self.progress.emit(float(d['downloaded_bytes'] / 1024 / 1024))
+                value = float(d['downloaded_bytes'] / 1024 / 1024)
+            else:
+                return
+            # Always deliver the final value of each file
+            self._emit_progress(value, force=d['status'] == 'finished')
+    
+    def _emit_progress(self, value: float, force: bool = False) -> None:
+        """Emit progress at most every 200ms unless it moved by a whole percent."""
+        now = time.monotonic_ns()
+        if (force or now - self._last_emit_ns >= 200_000_000
+                or abs(value - self._last_pct) >= 1.0):
+            self._last_emit_ns = now
+            self._last_pct = value
+            self.progress.emit(value)
                 
     def run(self):
         """Run the download process."""
         try:
             ydl_opts = {
+                **_BASE_YDL_OPTS,
                 'format': self.format_id,
-                'outtmpl': os.path.join(self.download_path, '%(title)s.%(ext)s'),
+                'outtmpl': self._outtmpl,
                 'progress_hooks': [self.progress_hook],
-                'quiet': True,
-                'no_warnings': True
+                # Request media in ranges over several connections; YouTube
+                # throttles long single-connection transfers
+                'http_chunk_size': self.http_chunk_size,
+                'concurrent_fragment_downloads': 4,
+                # yt-dlp writes each block it reads in a single write() call, so
+                # the block size also sets the file write size; no larger open()
+                # buffering is needed. This is only the starting size: yt-dlp then
+                # follows the measured throughput, halving or doubling the block
+                # on each read, capped at 4 MiB.
+                'buffersize': 1024 * 1024,
+                'retries': 10,
+                'fragment_retries': 10,
             }
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -206,72 +321,123 @@ class DownloaderThread(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+class InfoFetcherThread(QThread):
+    """Worker thread for extracting video information."""
+    
+    info_ready = pyqtSignal(dict)
+    error = pyqtSignal(str)
+    
+    def __init__(self, url: str, ydl: yt_dlp.YoutubeDL, ydl_lock: threading.Lock):
+        super().__init__()
+        self.url = url
+        self.ydl = ydl
+        self.ydl_lock = ydl_lock
+        
+    def run(self):
+        """Extract the video information without downloading."""
+        try:
+            with self.ydl_lock:
+                info = self.ydl.extract_info(self.url, download=False)
+            self.info_ready.emit(info)
+        except Exception as e:
+            self.error.emit(str(e))
+
+# Page hosting the embedded player; later previews only swap the iframe's src
+PREVIEW_HTML = '''
+    <html>
+        <body style="margin: 0; background-color: #121212;">
+            <iframe 
+                id="yt"
+                width="100%" 
+                height="100%" 
+                src="{src}"
+                frameborder="0" 
+                allowfullscreen>
+            </iframe>
+        </body>
+    </html>
+'''
+
 class VideoPreviewWidget(QFrame):
     """A widget to show video preview and thumbnail."""
     
+    # Scaled thumbnails already downloaded this session, keyed by thumbnail URL
+    _thumbnail_cache: Dict[str, QPixmap] = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._network = QNetworkAccessManager(self)
+        # Thumbnail most recently requested; replies for any other URL are stale
+        self._thumbnail_url: Optional[str] = None
         self.setObjectName("previewFrame")
-        self.setStyleSheet("""
-            #previewFrame {
-                background-color: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
         
         layout = QVBoxLayout(self)
         
         # Thumbnail label
         self.thumbnail_label = QLabel()
+        self.thumbnail_label.setObjectName("thumbnailLabel")
         self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.thumbnail_label.setMinimumHeight(200)
-        self.thumbnail_label.setStyleSheet("border-radius: 5px;")
         layout.addWidget(self.thumbnail_label)
         
-        # Web view for video preview
-        self.web_view = QWebEngineView()
-        self.web_view.setMinimumHeight(300)
-        self.web_view.setStyleSheet("border-radius: 5px;")
-        layout.addWidget(self.web_view)
+        # Web view for video preview, created on the first set_preview call
+        # in place of this placeholder
+        self.web_view = None
+        self._web_placeholder = QWidget()
+        layout.addWidget(self._web_placeholder)
         
         # Initially hide the preview
         self.setVisible(False)
     
-    def set_thumbnail(self, url: str):
-        """Set the video thumbnail."""
-        # Download thumbnail using yt-dlp
-        try:
-            with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                thumbnail_url = info.get('thumbnail')
-                if thumbnail_url:
-                    # Download thumbnail using requests
-                    import requests
-                    response = requests.get(thumbnail_url)
-                    if response.status_code == 200:
-                        pixmap = QPixmap()
-                        pixmap.loadFromData(response.content)
-                        scaled_pixmap = pixmap.scaled(640, 360, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        self.thumbnail_label.setPixmap(scaled_pixmap)
-        except Exception as e:
-            print(f"Error loading thumbnail: {e}")
+    def set_thumbnail(self, thumbnail_url: Optional[str]):
+        """Set the video thumbnail, downloading it asynchronously unless cached."""
+        self._thumbnail_url = thumbnail_url
+        if not thumbnail_url:
+            self.thumbnail_label.clear()
+            return
+        
+        pixmap = self._thumbnail_cache.get(thumbnail_url)
+        if pixmap is not None:
+            self.thumbnail_label.setPixmap(pixmap)
+            return
+        
+        reply = self._network.get(QNetworkRequest(QUrl(thumbnail_url)))
+        reply.finished.connect(partial(self._thumbnail_loaded, reply, thumbnail_url))
+    
+    def _thumbnail_loaded(self, reply: QNetworkReply, thumbnail_url: str):
+        """Show a downloaded thumbnail."""
+        reply.deleteLater()
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            print(f"Error loading thumbnail: {reply.errorString()}")
+            return
+        
+        pixmap = QPixmap()
+        pixmap.loadFromData(reply.readAll())
+        scaled_pixmap = pixmap.scaled(640, 360, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        self._thumbnail_cache[thumbnail_url] = scaled_pixmap
+        # A newer video may have been fetched while this reply was in flight
+        if thumbnail_url == self._thumbnail_url:
+            self.thumbnail_label.setPixmap(scaled_pixmap)
     
     def set_preview(self, video_id: str):
         """Set the video preview using YouTube embed."""
-        self.web_view.setHtml(f'''
-            <html>
-                <body style="margin: 0; background-color: #121212;">
-                    <iframe 
-                        width="100%" 
-                        height="100%" 
-                        src="https://www.youtube.com/embed/{video_id}"
-                        frameborder="0" 
-                        allowfullscreen>
-                    </iframe>
-                </body>
-            </html>
-        ''')
+        # Without PyQt6-WebEngine only the thumbnail is shown
+        if QWebEngineView is not None:
+            embed_url = f"https://www.youtube.com/embed/{video_id}"
+            if self.web_view is None:
+                # Start the embedded browser only once a preview is actually shown
+                self.web_view = QWebEngineView()
+                self.web_view.setObjectName("previewWebView")
+                self.web_view.setMinimumHeight(300)
+                self.layout().replaceWidget(self._web_placeholder, self.web_view)
+                self._web_placeholder.deleteLater()
+                self._web_placeholder = None
+                self.web_view.setHtml(PREVIEW_HTML.format(src=embed_url), QUrl("https://www.youtube.com"))
+            else:
+                # Keep the loaded page and just point its iframe at the new video
+                self.web_view.page().runJavaScript(
+                    f"document.getElementById('yt').src = {json.dumps(embed_url)};"
+                )
         self.setVisible(True)
 
 class DownloadHistoryWidget(MaterialFrame):
@@ -283,31 +449,27 @@ class DownloadHistoryWidget(MaterialFrame):
         
         # Header
         header = QLabel("Recent Downloads")
-        header.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #009688;
-            margin-bottom: 10px;
-        """)
+        header.setObjectName("historyHeader")
         layout.addWidget(header)
         
         # Downloads list
         self.downloads_list = QTableWidget()
+        self.downloads_list.setObjectName("historyList")
         self.downloads_list.setColumnCount(2)
         self.downloads_list.setHorizontalHeaderLabels(["File", "Actions"])
         self.downloads_list.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.downloads_list.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
         self.downloads_list.setColumnWidth(1, 100)
-        self.downloads_list.setStyleSheet("""
-            QTableWidget {
-                background-color: transparent;
-                border: none;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-        """)
         layout.addWidget(self.downloads_list)
+        
+        # One actions menu shared by every row, pointed at the clicked row's file
+        self._menu_filename = None
+        self.actions_menu = QMenu(self)
+        self.actions_menu.setObjectName("historyMenu")
+        open_action = self.actions_menu.addAction("Open File")
+        open_folder_action = self.actions_menu.addAction("Show in Folder")
+        open_action.triggered.connect(lambda: self.open_file(self._menu_filename))
+        open_folder_action.triggered.connect(lambda: self.show_in_folder(self._menu_filename))
     
     def add_download(self, filename: str):
         """Add a new download to the history."""
@@ -315,7 +477,7 @@ class DownloadHistoryWidget(MaterialFrame):
         self.downloads_list.insertRow(row)
         
         # File name
-        self.downloads_list.setItem(row, 0, QTableWidgetItem(os.path.basename(filename)))
+        self.downloads_list.setItem(row, 0, QTableWidgetItem(Path(filename).name))
         
         # Actions button
         actions_widget = QWidget()
@@ -323,46 +485,17 @@ class DownloadHistoryWidget(MaterialFrame):
         actions_layout.setContentsMargins(0, 0, 0, 0)
         
         actions_btn = QToolButton()
+        actions_btn.setObjectName("historyActionsBtn")
         actions_btn.setText("⋮")
-        actions_btn.setStyleSheet("""
-            QToolButton {
-                border: none;
-                padding: 5px;
-                color: white;
-            }
-            QToolButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 3px;
-            }
-        """)
-        
-        menu = QMenu(actions_btn)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #424242;
-                border: 1px solid #555;
-                border-radius: 3px;
-            }
-            QMenu::item {
-                padding: 5px 20px;
-                color: white;
-            }
-            QMenu::item:selected {
-                background-color: #009688;
-            }
-        """)
-        
-        open_action = menu.addAction("Open File")
-        open_folder_action = menu.addAction("Show in Folder")
-        
-        actions_btn.setMenu(menu)
+        actions_btn.clicked.connect(partial(self._show_actions_menu, actions_btn, filename))
         actions_layout.addWidget(actions_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
         self.downloads_list.setCellWidget(row, 1, actions_widget)
-        
-        # Connect actions
-        open_action.triggered.connect(lambda: self.open_file(filename))
-        open_folder_action.triggered.connect(lambda: self.show_in_folder(filename))
+    
+    def _show_actions_menu(self, button: QToolButton, filename: str, checked: bool = False):
+        """Show the shared actions menu for a row below its button."""
+        self._menu_filename = filename
+        self.actions_menu.popup(button.mapToGlobal(button.rect().bottomLeft()))
     
     def open_file(self, filename: str):
         """Open the downloaded file."""
@@ -371,12 +504,7 @@ class DownloadHistoryWidget(MaterialFrame):
     def show_in_folder(self, filename: str):
         """Show the file in its folder."""
         try:
-            if platform.system() == 'Windows':
-                os.startfile(os.path.dirname(filename))
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', '-R', filename])
-            else:  # Linux
-                subprocess.run(['xdg-open', os.path.dirname(filename)])
+            _reveal(filename)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open folder: {str(e)}")
 
@@ -392,6 +520,16 @@ class VideoDownloaderGUI(QMainWindow):
         self.download_path = Path.home() / "Downloads" / "VideoDownloader"
         self.download_path.mkdir(parents=True, exist_ok=True)
         
+        # Guards the shared YoutubeDL instance, which is also used from worker threads
+        self._ydl_lock = threading.Lock()
+        self.info_thread: Optional[InfoFetcherThread] = None
+        
+        # Opacity animations used by fade_widget, keyed by the widget they fade
+        self._fade_animations: Dict[QWidget, QPropertyAnimation] = {}
+        
+        # Last whole percentage shown by the progress bar
+        self._last_pct_int = -1
+        
         # Initialize UI
         self.init_ui()
         
@@ -405,6 +543,26 @@ class VideoDownloaderGUI(QMainWindow):
         self.fade_in_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         QTimer.singleShot(100, self.fade_in_animation.start)
         
+    @cached_property
+    def _ydl(self) -> yt_dlp.YoutubeDL:
+        """YoutubeDL instance shared by every info lookup, created on first use."""
+        # YoutubeDL fills in defaults on the dict it is given, so hand it a copy
+        return yt_dlp.YoutubeDL(dict(_BASE_YDL_OPTS))
+    
+    def closeEvent(self, event):
+        """Release the shared YoutubeDL instance when the window closes."""
+        # Give a running info lookup a moment to finish so the thread is not
+        # destroyed mid-run, but never hang the UI on a slow network call
+        if self.info_thread is not None and self.info_thread.isRunning():
+            self.info_thread.wait(INFO_THREAD_CLOSE_TIMEOUT_MS)
+        # Only close the YoutubeDL if no lookup is still using it
+        if '_ydl' in self.__dict__ and self._ydl_lock.acquire(blocking=False):
+            try:
+                self._ydl.close()
+            finally:
+                self._ydl_lock.release()
+        super().closeEvent(event)
+    
     def init_ui(self):
         """Initialize the user interface."""
         central_widget = QWidget()
@@ -420,12 +578,7 @@ class VideoDownloaderGUI(QMainWindow):
         
         # Title
         title_label = QLabel("YouTube Video Downloader")
-        title_label.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: #009688;
-            margin-bottom: 20px;
-        """)
+        title_label.setObjectName("titleLabel")
         left_layout.addWidget(title_label, alignment=Qt.AlignmentFlag.AlignCenter)
         
         # URL input
@@ -449,12 +602,8 @@ class VideoDownloaderGUI(QMainWindow):
         info_frame = MaterialFrame()
         info_layout = QVBoxLayout(info_frame)
         self.info_label = QLabel()
+        self.info_label.setObjectName("infoLabel")
         self.info_label.setWordWrap(True)
-        self.info_label.setStyleSheet("""
-            font-size: 14px;
-            color: rgba(255, 255, 255, 0.87);
-            padding: 10px;
-        """)
         info_layout.addWidget(self.info_label)
         left_layout.addWidget(info_frame)
         
@@ -475,10 +624,7 @@ class VideoDownloaderGUI(QMainWindow):
         self.progress_bar = MaterialProgressBar()
         self.progress_bar.setMinimumHeight(30)
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("""
-            font-size: 13px;
-            color: rgba(255, 255, 255, 0.6);
-        """)
+        self.status_label.setObjectName("statusLabel")
         progress_layout.addWidget(self.progress_bar)
         progress_layout.addWidget(self.status_label)
         left_layout.addWidget(progress_frame)
@@ -513,14 +659,19 @@ class VideoDownloaderGUI(QMainWindow):
     
     def fade_widget(self, widget: QWidget, fade_in: bool):
         """Create a fade animation for a widget."""
-        effect = QGraphicsOpacityEffect(widget)
-        widget.setGraphicsEffect(effect)
-        
-        animation = QPropertyAnimation(effect, b"opacity")
-        animation.setDuration(300)
+        animation = self._fade_animations.get(widget)
+        if animation is None:
+            # Each widget gets one effect and animation, reused by later fades
+            effect = QGraphicsOpacityEffect(widget)
+            widget.setGraphicsEffect(effect)
+            animation = QPropertyAnimation(effect, b"opacity", effect)
+            animation.setDuration(300)
+            animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
+            self._fade_animations[widget] = animation
+        
+        animation.stop()
         animation.setStartValue(0 if fade_in else 1)
         animation.setEndValue(1 if fade_in else 0)
-        animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
         animation.start()
         
     def fetch_video_info(self):
@@ -530,64 +681,72 @@ class VideoDownloaderGUI(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter a video URL")
             return
         
+        self.fetch_button.setEnabled(False)
+        self.info_label.setText("Fetching video information...")
+        self.fade_widget(self.info_label, True)
+        
+        # Extract the info off the GUI thread; the result arrives in video_info_ready
+        self.info_thread = InfoFetcherThread(url, self._ydl, self._ydl_lock)
+        self.info_thread.info_ready.connect(self.video_info_ready)
+        self.info_thread.error.connect(self.video_info_error)
+        self.info_thread.start()
+    
+    def video_info_ready(self, info: Dict[str, Any]):
+        """Show the fetched video information and available formats."""
         try:
-            self.fetch_button.setEnabled(False)
-            self.info_label.setText("Fetching video information...")
-            self.fade_widget(self.info_label, True)
+            # Update preview
+            if 'id' in info:
+                self.preview_widget.set_thumbnail(info.get('thumbnail'))
+                self.preview_widget.set_preview(info['id'])
             
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True
-            }
+            # Display video info with fade animation
+            self.fade_widget(self.info_label, False)
+            QTimer.singleShot(300, lambda: self.update_video_info(info))
+            
+            # Update formats table, sized once and filled with repaints suspended
+            formats = [
+                f for f in info.get('formats', [])
+                if 'height' in f and f.get('vcodec', 'none') != 'none'
+            ]
+            self.formats_table.setUpdatesEnabled(False)
+            try:
+                self.formats_table.setRowCount(len(formats))
+                for row, f in enumerate(formats):
+                    # Quality
+                    quality = f"{f.get('height', 'N/A')}p"
+                    if f.get('fps'):
+                        quality += f" {f['fps']}fps"
+                    self.formats_table.setItem(row, 0, QTableWidgetItem(quality))
+                    
+                    # Extension
+                    self.formats_table.setItem(row, 1, QTableWidgetItem(f.get('ext', 'N/A')))
+                    
+                    # Size
+                    filesize = f.get('filesize', 0)
+                    if filesize > 0:
+                        size = f"{filesize / 1024 / 1024:.1f} MB"
+                    else:
+                        size = "N/A"
+                    self.formats_table.setItem(row, 2, QTableWidgetItem(size))
+                    
+                    # Format code
+                    self.formats_table.setItem(row, 3, QTableWidgetItem(str(f['format_id'])))
+            finally:
+                self.formats_table.setUpdatesEnabled(True)
+            self.formats_table.viewport().update()
+            
+            self.download_button.setEnabled(True)
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                # Update preview
-                if 'id' in info:
-                    self.preview_widget.set_thumbnail(url)
-                    self.preview_widget.set_preview(info['id'])
-                
-                # Display video info with fade animation
-                self.fade_widget(self.info_label, False)
-                QTimer.singleShot(300, lambda: self.update_video_info(info))
-                
-                # Update formats table
-                self.formats_table.setRowCount(0)
-                formats = info.get('formats', [])
-                
-                for f in formats:
-                    if 'height' in f and f.get('vcodec', 'none') != 'none':
-                        row = self.formats_table.rowCount()
-                        self.formats_table.insertRow(row)
-                        
-                        # Quality
-                        quality = f"{f.get('height', 'N/A')}p"
-                        if f.get('fps'):
-                            quality += f" {f['fps']}fps"
-                        self.formats_table.setItem(row, 0, QTableWidgetItem(quality))
-                        
-                        # Extension
-                        self.formats_table.setItem(row, 1, QTableWidgetItem(f.get('ext', 'N/A')))
-                        
-                        # Size
-                        filesize = f.get('filesize', 0)
-                        if filesize > 0:
-                            size = f"{filesize / 1024 / 1024:.1f} MB"
-                        else:
-                            size = "N/A"
-                        self.formats_table.setItem(row, 2, QTableWidgetItem(size))
-                        
-                        # Format code
-                        self.formats_table.setItem(row, 3, QTableWidgetItem(str(f['format_id'])))
-                
-                self.download_button.setEnabled(True)
-                
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error fetching video info: {str(e)}")
         finally:
             self.fetch_button.setEnabled(True)
     
+    def video_info_error(self, error: str):
+        """Handle a failed video info lookup."""
+        self.fetch_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Error fetching video info: {error}")
+    
     def update_video_info(self, info: Dict[str, Any]):
         """Update video information with fade effect."""
         self.info_label.setText(
@@ -615,6 +774,7 @@ class VideoDownloaderGUI(QMainWindow):
         
         self.download_button.setEnabled(False)
         self.fetch_button.setEnabled(False)
+        self._last_pct_int = 0
         self.progress_bar.setValue(0)
         self.status_label.setText("Downloading...")
         
@@ -622,12 +782,19 @@ class VideoDownloaderGUI(QMainWindow):
     
     def update_progress(self, percentage: float):
         """Update the progress bar."""
-        self.progress_bar.setValue(int(percentage))
+        value = int(percentage)
+        # Progress arrives many times per percent; only repaint when the shown value changes
+        if value == self._last_pct_int:
+            return
+        self._last_pct_int = value
+        self.progress_bar.setValue(value)
     
     def download_finished(self, filename: str):
         """Handle download completion."""
+        name = Path(filename).name
+        self._last_pct_int = 100
         self.progress_bar.setValue(100)
-        self.status_label.setText(f"Downloaded: {os.path.basename(filename)}")
+        self.status_label.setText(f"Downloaded: {name}")
         self.download_button.setEnabled(True)
         self.fetch_button.setEnabled(True)
         
@@ -636,47 +803,23 @@ class VideoDownloaderGUI(QMainWindow):
         
         # Show success message with options
         msg = QMessageBox(self)
+        msg.setObjectName("downloadMsg")
         msg.setIcon(QMessageBox.Icon.Information)
         msg.setWindowTitle("Success")
         msg.setText("Download completed!")
-        msg.setInformativeText(f"File saved as: {os.path.basename(filename)}")
+        msg.setInformativeText(f"File saved as: {name}")
         
         open_button = msg.addButton("Open File", QMessageBox.ButtonRole.ActionRole)
         show_folder_button = msg.addButton("Show in Folder", QMessageBox.ButtonRole.ActionRole)
         close_button = msg.addButton("Close", QMessageBox.ButtonRole.RejectRole)
         
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #424242;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QPushButton {
-                background-color: #009688;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 3px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #00796B;
-            }
-        """)
-        
         msg.exec()
         
         try:
             if msg.clickedButton() == open_button:
                 QDesktopServices.openUrl(QUrl.fromLocalFile(filename))
             elif msg.clickedButton() == show_folder_button:
-                if platform.system() == 'Windows':
-                    os.startfile(os.path.dirname(filename))
-                elif platform.system() == 'Darwin':  # macOS
-                    subprocess.run(['open', '-R', filename])
-                else:  # Linux
-                    subprocess.run(['xdg-open', os.path.dirname(filename)])
+                _reveal(filename)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open file or folder: {str(e)}")
     
@@ -687,28 +830,11 @@ class VideoDownloaderGUI(QMainWindow):
         self.fetch_button.setEnabled(True)
         
         msg = QMessageBox(self)
+        msg.setObjectName("errorMsg")
         msg.setIcon(QMessageBox.Icon.Critical)
         msg.setWindowTitle("Error")
         msg.setText("Download failed!")
         msg.setInformativeText(str(error))
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #424242;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QPushButton {
-                background-color: #009688;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #00796B;
-            }
-        """)
         msg.exec()
 
 def main():
@@ -719,9 +845,9 @@ def main():
     apply_stylesheet(app, theme='dark_teal.xml')
     
     # Override some styles with platform-specific fonts
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         font_family = 'Segoe UI'
-    elif platform.system() == 'Darwin':  # macOS
+    elif _SYSTEM == 'Darwin':  # macOS
         font_family = '-apple-system'  # Changed from SF Pro Text
     else:  # Linux
         font_family = 'Roboto'
@@ -742,7 +868,7 @@ def main():
             border: none;
             font-weight: bold;
         }}
-    """)
+    """ + APP_QSS)
     
     # Create and show main window
     window = VideoDownloaderGUI()